@@ -294,7 +294,9 @@ def main(argv):
         }
 
     # Automatically load BUILDRULES from the src_dir
-    sys.path.append(args.src_dir)
+    # Avoid growing sys.path when main() is called repeatedly in-process
+    if args.src_dir not in sys.path:
+        sys.path.append(args.src_dir)
     try:
         import BUILDRULES
     except ImportError:
@@ -297,7 +297,7 @@ def _preprocess_file_filters(requests, config, io):
         for request in requests
     )
     all_categories.remove(None)
-    all_categories = list(sorted(all_categories))
+    all_categories = sorted(all_categories)
     json_data = config.filters_json_data
     filters = {}
     default_filter_json = "exclude" if config.strategy == "additive" else "include"
@@ -12,6 +12,9 @@
 
 import platform
 
+# The host OS does not change during a run; query it once rather than per rule.
+PLATFORM_OS = platform.system()
+
 def get_gnumake_rules(build_dirs, requests, makefile_vars, **kwargs):
     makefile_string = ""
 
@@ -89,9 +92,8 @@ def get_gnumake_rules_helper(request, common_vars, **kwargs):
 
     if isinstance(request, PrintFileRequest):
         var_name = "%s_CONTENT" % request.name.upper()
-        platform_os = platform.system()
         cmds = []
-        if platform_os in ["OS390", "OS/390", "zos"] and request.shall_be_utf8:
+        if PLATFORM_OS in ["OS390", "OS/390", "zos"] and request.shall_be_utf8:
             cmds.append(
                     '''echo "$${VAR_NAME}" | iconv -f IBM-1047 -T -t UTF-8 > {MAKEFILENAME}'''.format(
                         VAR_NAME = var_name,
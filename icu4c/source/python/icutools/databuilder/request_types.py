@@ -268,9 +268,9 @@ def __init__(self, **kwargs):
         super(ListRequest, self).__init__(**kwargs)
 
     def flatten(self, config, all_requests, common_vars):
-        list_files = list(sorted(utils.get_all_output_files(all_requests)))
+        list_files = sorted(utils.get_all_output_files(all_requests))
         if self.include_tmp:
-            variable_files = list(sorted(utils.get_all_output_files(all_requests, include_tmp=True)))
+            variable_files = sorted(utils.get_all_output_files(all_requests, include_tmp=True))
         else:
             # Always include the list file itself
             variable_files = list_files + [self.output_file]
@@ -134,7 +134,7 @@ def compute_directories(requests):
     for file in get_all_output_files(requests, include_tmp=True):
         path = "%s/%s" % (dir_for(file), file.filename)
         dirs.add(path[:path.rfind("/")])
-    return list(sorted(dirs))
+    return sorted(dirs)
 
 
 class SpaceSeparatedList(list):